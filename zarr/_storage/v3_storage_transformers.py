@@ -1,7 +1,8 @@
 import functools
 import itertools
 import os
-from typing import NamedTuple, Tuple, Optional, Union, Iterator
+import threading
+from typing import List, NamedTuple, Tuple, Optional, Union, Iterator
 
 from numcodecs.compat import ensure_bytes
 import numpy as np
@@ -13,6 +14,13 @@ from zarr.types import DIMENSION_SEPARATOR
 
 MAX_UINT_64 = 2**64 - 1
 
+# Updating a chunk rewrites its whole shard, so writes to chunks of the same
+# shard are serialized, while writes to different shards can proceed
+# concurrently. Shard keys are mapped onto a fixed, process-wide pool of locks,
+# which is shared by all copies of a transformer and by all arrays opened on the
+# same store.
+_SHARD_LOCKS = [threading.Lock() for _ in range(64)]
+
 
 v3_sharding_available = os.environ.get("ZARR_V3_SHARDING", "0").lower() not in ["0", "false"]
 
@@ -82,6 +90,30 @@ class _ShardIndex(NamedTuple):
         )
 
 
+def _coalesce_key_ranges(
+    key_ranges: List[Tuple[str, Tuple[int, int]]]
+) -> Tuple[List[Tuple[str, Tuple[int, int]]], List[Tuple[int, int, int]]]:
+    """Merge adjacent or overlapping byte ranges of the same key.
+
+    Returns the merged ``(key, (start, length))`` requests and, for each input
+    range, a ``(request_index, offset, length)`` triplet locating it within the
+    merged request it has been folded into."""
+    order = sorted(range(len(key_ranges)), key=lambda i: (key_ranges[i][0], key_ranges[i][1][0]))
+    merged: List[Tuple[str, Tuple[int, int]]] = []
+    locations: List[Tuple[int, int, int]] = [(0, 0, 0)] * len(key_ranges)
+    for i in order:
+        key, (start, length) = key_ranges[i]
+        if merged:
+            last_key, (last_start, last_length) = merged[-1]
+            if last_key == key and start <= last_start + last_length:
+                merged[-1] = (key, (last_start, max(last_length, start + length - last_start)))
+                locations[i] = (len(merged) - 1, start - last_start, length)
+                continue
+        merged.append((key, (start, length)))
+        locations[i] = (len(merged) - 1, 0, length)
+    return merged, locations
+
+
 class ShardingStorageTransformer(StorageTransformer):  # lgtm[py/missing-equals]
     """Implements sharding as a storage transformer, as described in the spec:
     https://zarr-specs.readthedocs.io/en/latest/extensions/storage-transformers/sharding/v1.0.html
@@ -142,6 +174,9 @@ class ShardingStorageTransformer(StorageTransformer):  # lgtm[py/missing-equals]
         shard_key = prefix + "c" + self.dimension_separator.join(map(str, shard_key_tuple))
         return shard_key, chunk_subkeys
 
+    def _shard_lock(self, shard_key: str) -> threading.Lock:
+        return _SHARD_LOCKS[hash(shard_key) % len(_SHARD_LOCKS)]
+
     def _get_index_from_store(self, shard_key: str) -> _ShardIndex:
         # At the end of each shard 2*64bit per chunk for offset and length define the index:
         index_bytes = self.inner_store.get_partial_values(
@@ -198,83 +233,93 @@ class ShardingStorageTransformer(StorageTransformer):  # lgtm[py/missing-equals]
         value = ensure_bytes(value)
         if self._is_data_key(key):
             shard_key, chunk_subkey = self._key_to_shard(key)
-            chunks_to_read = set(self._get_chunks_in_shard(shard_key))
-            chunks_to_read.remove(chunk_subkey)
-            new_content = {chunk_subkey: value}
-            try:
-                if self.supports_efficient_get_partial_values:
-                    index = self._get_index_from_store(shard_key)
-                    full_shard_value = None
-                else:
-                    full_shard_value = self.inner_store[shard_key]
-                    index = self._get_index_from_buffer(full_shard_value)
-            except KeyError:
-                index = _ShardIndex.create_empty(self)
+            with self._shard_lock(shard_key):
+                self._set_chunk_in_shard(shard_key, chunk_subkey, value)
+        else:  # pragma: no cover
+            self.inner_store[key] = value
+
+    def _set_chunk_in_shard(self, shard_key: str, chunk_subkey: Tuple[int, ...], value) -> None:
+        chunks_to_read = set(self._get_chunks_in_shard(shard_key))
+        chunks_to_read.remove(chunk_subkey)
+        new_content = {chunk_subkey: value}
+        try:
+            if self.supports_efficient_get_partial_values:
+                index = self._get_index_from_store(shard_key)
+                full_shard_value = None
             else:
-                chunk_slices = [
-                    (chunk_to_read, index.get_chunk_slice(chunk_to_read))
-                    for chunk_to_read in chunks_to_read
-                ]
-                valid_chunk_slices = [
-                    (chunk_to_read, chunk_slice)
-                    for chunk_to_read, chunk_slice in chunk_slices
-                    if chunk_slice is not None
-                ]
-                # use get_partial_values if less than half of the available chunks must be read:
-                # (This can be changed when set_partial_values can be used efficiently.)
-                use_partial_get = (
-                    self.supports_efficient_get_partial_values
-                    and len(valid_chunk_slices) < len(chunk_slices) / 2
-                )
+                full_shard_value = self.inner_store[shard_key]
+                index = self._get_index_from_buffer(full_shard_value)
+        except KeyError:
+            index = _ShardIndex.create_empty(self)
+        else:
+            chunk_slices = [
+                (chunk_to_read, index.get_chunk_slice(chunk_to_read))
+                for chunk_to_read in chunks_to_read
+            ]
+            valid_chunk_slices = [
+                (chunk_to_read, chunk_slice)
+                for chunk_to_read, chunk_slice in chunk_slices
+                if chunk_slice is not None
+            ]
+            # use get_partial_values if less than half of the available chunks must be read:
+            # (This can be changed when set_partial_values can be used efficiently.)
+            use_partial_get = (
+                self.supports_efficient_get_partial_values
+                and len(valid_chunk_slices) < len(chunk_slices) / 2
+            )
 
-                if use_partial_get:
-                    chunk_values = self.inner_store.get_partial_values(
-                        [
+            if use_partial_get:
+                chunk_values = self.inner_store.get_partial_values(
+                    [
+                        (
+                            shard_key,
                             (
-                                shard_key,
-                                (
-                                    chunk_slice.start,
-                                    chunk_slice.stop - chunk_slice.start,
-                                ),
-                            )
-                            for _, chunk_slice in valid_chunk_slices
-                        ]
-                    )
-                    for chunk_value, (chunk_to_read, _) in zip(chunk_values, valid_chunk_slices):
-                        new_content[chunk_to_read] = chunk_value
-                else:
-                    if full_shard_value is None:
-                        full_shard_value = self.inner_store[shard_key]
-                    for chunk_to_read, chunk_slice in valid_chunk_slices:
-                        if chunk_slice is not None:
-                            new_content[chunk_to_read] = full_shard_value[chunk_slice]
-
-            shard_content = b""
-            for chunk_subkey, chunk_content in new_content.items():
-                chunk_slice = slice(len(shard_content), len(shard_content) + len(chunk_content))
-                index.set_chunk_slice(chunk_subkey, chunk_slice)
-                shard_content += chunk_content
-            # Appending the index at the end of the shard:
-            shard_content += index.to_bytes()
-            self.inner_store[shard_key] = shard_content
-        else:  # pragma: no cover
-            self.inner_store[key] = value
+                                chunk_slice.start,
+                                chunk_slice.stop - chunk_slice.start,
+                            ),
+                        )
+                        for _, chunk_slice in valid_chunk_slices
+                    ]
+                )
+                for chunk_value, (chunk_to_read, _) in zip(chunk_values, valid_chunk_slices):
+                    new_content[chunk_to_read] = chunk_value
+            else:
+                if full_shard_value is None:
+                    full_shard_value = self.inner_store[shard_key]
+                full_shard_view = memoryview(full_shard_value)
+                for chunk_to_read, chunk_slice in valid_chunk_slices:
+                    if chunk_slice is not None:
+                        new_content[chunk_to_read] = full_shard_view[chunk_slice]
+
+        shard_parts = []
+        shard_length = 0
+        for chunk_subkey, chunk_content in new_content.items():
+            chunk_length = len(chunk_content)
+            index.set_chunk_slice(chunk_subkey, slice(shard_length, shard_length + chunk_length))
+            shard_parts.append(chunk_content)
+            shard_length += chunk_length
+        # Appending the index at the end of the shard:
+        shard_parts.append(index.to_bytes())
+        self.inner_store[shard_key] = b"".join(shard_parts)
 
     def __delitem__(self, key):
         if self._is_data_key(key):
             shard_key, chunk_subkey = self._key_to_shard(key)
-            try:
-                index = self._get_index_from_store(shard_key)
-            except KeyError:
-                raise KeyError(key)
+            with self._shard_lock(shard_key):
+                try:
+                    index = self._get_index_from_store(shard_key)
+                except KeyError:
+                    raise KeyError(key)
 
-            index.set_chunk_slice(chunk_subkey, None)
+                index.set_chunk_slice(chunk_subkey, None)
 
-            if index.is_all_empty():
-                del self.inner_store[shard_key]
-            else:
-                index_bytes = index.to_bytes()
-                self.inner_store.set_partial_values([(shard_key, -len(index_bytes), index_bytes)])
+                if index.is_all_empty():
+                    del self.inner_store[shard_key]
+                else:
+                    index_bytes = index.to_bytes()
+                    self.inner_store.set_partial_values(
+                        [(shard_key, -len(index_bytes), index_bytes)]
+                    )
         else:  # pragma: no cover
             del self.inner_store[key]
 
@@ -324,12 +369,68 @@ class ShardingStorageTransformer(StorageTransformer):  # lgtm[py/missing-equals]
                     )
                 else:  # pragma: no cover
                     transformed_key_ranges.append((key, range_))
-            values = self.inner_store.get_partial_values(transformed_key_ranges)
+            values = self._get_coalesced_partial_values(transformed_key_ranges)
             for i in none_indices:
                 values.insert(i, None)
             return values
         else:
-            return StoreV3.get_partial_values(self, key_ranges)
+            # Read each shard only once, and hand out views on it rather than
+            # copying every chunk out of the shard.
+            values = [None] * len(key_ranges)
+            shards = {}
+            for i, (key, range_) in enumerate(key_ranges):
+                if not self._is_data_key(key):  # pragma: no cover
+                    values[i] = StoreV3.get_partial_values(self, [(key, range_)])[0]
+                    continue
+                shard_key, chunk_subkey = self._key_to_shard(key)
+                if shard_key not in shards:
+                    try:
+                        full_shard_value = self.inner_store[shard_key]
+                    except KeyError:
+                        shards[shard_key] = None
+                    else:
+                        shards[shard_key] = (
+                            memoryview(full_shard_value),
+                            self._get_index_from_buffer(full_shard_value),
+                        )
+                if shards[shard_key] is None:
+                    continue
+                full_shard_view, index = shards[shard_key]
+                chunk_slice = index.get_chunk_slice(chunk_subkey)
+                if chunk_slice is None:
+                    continue
+                range_start, range_length = range_
+                chunk_view = full_shard_view[chunk_slice]
+                if range_length is None:
+                    values[i] = chunk_view[range_start:]
+                else:
+                    values[i] = chunk_view[range_start : range_start + range_length]
+            return values
+
+    def _get_coalesced_partial_values(self, key_ranges):
+        # Chunks stored next to each other within a shard are fetched with a
+        # single range request, and handed out as views on the merged value.
+        mergeable = [
+            i
+            for i, (_, (range_start, range_length)) in enumerate(key_ranges)
+            if range_start >= 0 and range_length is not None
+        ]
+        merged, locations = _coalesce_key_ranges([key_ranges[i] for i in mergeable])
+        if len(merged) == len(mergeable):
+            return self.inner_store.get_partial_values(key_ranges)
+        others = sorted(set(range(len(key_ranges))).difference(mergeable))
+        fetched = self.inner_store.get_partial_values(merged + [key_ranges[i] for i in others])
+        values = [None] * len(key_ranges)
+        for i, (request_index, offset, length) in zip(mergeable, locations):
+            value = fetched[request_index]
+            if value is not None:
+                if offset == 0 and length == len(value):
+                    values[i] = value
+                else:
+                    values[i] = memoryview(value)[offset : offset + length]
+        for i, value in zip(others, fetched[len(merged) :]):
+            values[i] = value
+        return values
 
     def supports_efficient_set_partial_values(self):
         return False
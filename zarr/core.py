@@ -2,6 +2,7 @@ import binascii
 import hashlib
 import itertools
 import math
+import numbers
 import operator
 import re
 from functools import reduce
@@ -10,7 +11,7 @@ from typing import Any
 import numpy as np
 from numcodecs.compat import ensure_bytes
 
-from zarr._storage.store import _prefix_to_attrs_key, assert_zarr_v3_api_available
+from zarr._storage.store import BaseStore, _prefix_to_attrs_key, assert_zarr_v3_api_available
 from zarr.attrs import Attributes
 from zarr.codecs import AsType, get_codec
 from zarr.context import Context
@@ -62,6 +63,9 @@ from zarr.util import (
 
 __all__ = ["Array"]
 
+# maximum number of chunk keys deleted in one ``delitems`` call when resizing
+_RESIZE_DELETE_BATCH_SIZE = 1000
+
 
 # noinspection PyUnresolvedReferences
 class Array:
@@ -112,6 +116,28 @@ class Array:
         to users. Use `numpy.empty(())` by default.
 
         .. versionadded:: 2.13
+
+    chunk_batch_size : int, optional
+        Maximum number of chunks retrieved from, or stored to, the chunk store
+        in a single ``getitems``/``setitems`` call. Selections spanning more
+        chunks are processed in successive batches, which bounds the amount of
+        encoded chunk data held in memory at any one time. If None (default),
+        all chunks overlapping a selection are processed in a single batch.
+
+        .. versionadded:: 2.18
+
+    codec_executor : concurrent.futures.Executor, optional
+        Executor used to decode and encode the chunks of a selection
+        concurrently, e.g., a :class:`concurrent.futures.ThreadPoolExecutor`.
+        Compressors implemented in C, such as Blosc and Zstd, release the GIL
+        so that chunks can be processed in parallel. Chunks are always decoded
+        with the executor, but only encoded with it when the chunk store
+        implements ``setitems`` (e.g., :class:`zarr.storage.FSStore`) and no
+        synchronizer is used, otherwise chunks are written one at a time. If
+        None (default), chunks are processed sequentially in the calling
+        thread. The executor is not preserved when the array is pickled.
+
+        .. versionadded:: 2.18
     """
 
     def __init__(
@@ -127,6 +153,8 @@ class Array:
         write_empty_chunks=True,
         zarr_version=None,
         meta_array=None,
+        chunk_batch_size=None,
+        codec_executor=None,
     ):
         # N.B., expect at this point store is fully initialized with all
         # configuration metadata fully specified and normalized
@@ -159,12 +187,21 @@ class Array:
             self._meta_array = np.empty_like(meta_array, shape=())
         else:
             self._meta_array = np.empty(())
+        if chunk_batch_size is not None and (
+            not isinstance(chunk_batch_size, numbers.Integral) or chunk_batch_size < 1
+        ):
+            raise ValueError("chunk_batch_size must be a positive integer or None")
+        self._chunk_batch_size = chunk_batch_size
+        self._codec_executor = codec_executor
         self._version = zarr_version
         if self._version == 3:
             self._data_key_prefix = "data/root/" + self._key_prefix
             self._data_path = "data/root/" + self._path
             self._hierarchy_metadata = _get_hierarchy_metadata(store=self._store)
             self._metadata_key_suffix = self._hierarchy_metadata["metadata_key_suffix"]
+        # resolve the metadata key once, for v3 stores this requires reading the
+        # hierarchy metadata which should not happen on every operation
+        self._meta_key = _prefix_to_array_key(self._store, self._key_prefix)
 
         # initialize metadata
         self._load_metadata()
@@ -192,14 +229,12 @@ class Array:
         if self._synchronizer is None:
             self._load_metadata_nosync()
         else:
-            mkey = _prefix_to_array_key(self._store, self._key_prefix)
-            with self._synchronizer[mkey]:
+            with self._synchronizer[self._meta_key]:
                 self._load_metadata_nosync()
 
     def _load_metadata_nosync(self):
         try:
-            mkey = _prefix_to_array_key(self._store, self._key_prefix)
-            meta_bytes = self._store[mkey]
+            meta_bytes = self._store[self._meta_key]
         except KeyError:
             raise ArrayNotFoundError(self._path)
         else:
@@ -311,8 +346,7 @@ class Array:
                     attributes=self.attrs.asdict(),
                 )
             )
-        mkey = _prefix_to_array_key(self._store, self._key_prefix)
-        self._store[mkey] = self._store._metadata_class.encode_array_metadata(meta)
+        self._store[self._meta_key] = self._store._metadata_class.encode_array_metadata(meta)
 
     @property
     def store(self):
@@ -564,6 +598,17 @@ class Array:
         """
         return self._meta_array
 
+    @property
+    def chunk_batch_size(self):
+        """Maximum number of chunks processed per store request, or None if
+        all chunks overlapping a selection are processed together."""
+        return self._chunk_batch_size
+
+    @property
+    def codec_executor(self):
+        """Executor used to decode and encode chunks concurrently, or None."""
+        return self._codec_executor
+
     def __eq__(self, other):
         return (
             isinstance(other, Array)
@@ -1339,15 +1384,16 @@ class Array:
 
         if math.prod(out_shape) > 0:
             # allow storage to get multiple items at once
-            lchunk_coords, lchunk_selection, lout_selection = zip(*indexer)
-            self._chunk_getitems(
-                lchunk_coords,
-                lchunk_selection,
-                out,
-                lout_selection,
-                drop_axes=indexer.drop_axes,
-                fields=fields,
-            )
+            for batch in self._iter_chunk_batches(indexer):
+                lchunk_coords, lchunk_selection, lout_selection = zip(*batch)
+                self._chunk_getitems(
+                    lchunk_coords,
+                    lchunk_selection,
+                    out,
+                    lout_selection,
+                    drop_axes=indexer.drop_axes,
+                    fields=fields,
+                )
         if out.shape:
             return out
         else:
@@ -1917,7 +1963,7 @@ class Array:
             chunk[selection] = value
 
         # remove chunk if write_empty_chunks is false and it only contains the fill value
-        if (not self.write_empty_chunks) and all_equal(self.fill_value, chunk):
+        if (not self._write_empty_chunks) and all_equal(self._fill_value, chunk):
             try:
                 del self.chunk_store[ckey]
                 return
@@ -1964,51 +2010,60 @@ class Array:
                 value = np.asanyarray(value, like=self._meta_array)
             check_array_shape("value", value, sel_shape)
 
+        # the same value is stored into every chunk if it is a scalar
+        value_is_scalar = sel_shape == () or is_scalar(value, self._dtype)
+
+        # handle missing singleton dimensions
+        if indexer.drop_axes:
+            item = [slice(None)] * self.ndim
+            for a in indexer.drop_axes:
+                item[a] = np.newaxis
+            item = tuple(item)
+        else:
+            item = None
+
         # iterate over chunks in range
         if (
             not hasattr(self.chunk_store, "setitems")
             or self._synchronizer is not None
-            or any(map(lambda x: x == 0, self.shape))
+            or 0 in self._shape
         ):
             # iterative approach
             for chunk_coords, chunk_selection, out_selection in indexer:
                 # extract data to store
-                if sel_shape == ():
-                    chunk_value = value
-                elif is_scalar(value, self._dtype):
+                if value_is_scalar:
                     chunk_value = value
                 else:
                     chunk_value = value[out_selection]
-                    # handle missing singleton dimensions
-                    if indexer.drop_axes:
-                        item = [slice(None)] * self.ndim
-                        for a in indexer.drop_axes:
-                            item[a] = np.newaxis
-                        item = tuple(item)
+                    if item is not None:
                         chunk_value = chunk_value[item]
 
                 # put data
                 self._chunk_setitem(chunk_coords, chunk_selection, chunk_value, fields=fields)
         else:
-            lchunk_coords, lchunk_selection, lout_selection = zip(*indexer)
-            chunk_values = []
-            for out_selection in lout_selection:
-                if sel_shape == ():
-                    chunk_values.append(value)
-                elif is_scalar(value, self._dtype):
-                    chunk_values.append(value)
+            for batch in self._iter_chunk_batches(indexer):
+                lchunk_coords, lchunk_selection, lout_selection = zip(*batch)
+                if value_is_scalar:
+                    chunk_values = [value] * len(lout_selection)
+                elif item is None:
+                    chunk_values = [value[out_selection] for out_selection in lout_selection]
                 else:
-                    cv = value[out_selection]
-                    # handle missing singleton dimensions
-                    if indexer.drop_axes:  # pragma: no cover
-                        item = [slice(None)] * self.ndim
-                        for a in indexer.drop_axes:
-                            item[a] = np.newaxis
-                        item = tuple(item)
-                        cv = chunk_value[item]
-                    chunk_values.append(cv)
-
-            self._chunk_setitems(lchunk_coords, lchunk_selection, chunk_values, fields=fields)
+                    chunk_values = [value[out_selection][item] for out_selection in lout_selection]
+
+                self._chunk_setitems(lchunk_coords, lchunk_selection, chunk_values, fields=fields)
+
+    def _iter_chunk_batches(self, indexer):
+        """Yield lists of ``(chunk_coords, chunk_selection, out_selection)``
+        tuples from `indexer`, at most ``chunk_batch_size`` at a time."""
+        if self._chunk_batch_size is None:
+            yield list(indexer)
+            return
+        it = iter(indexer)
+        while True:
+            batch = list(itertools.islice(it, self._chunk_batch_size))
+            if not batch:
+                return
+            yield batch
 
     def _process_chunk(
         self,
@@ -2050,9 +2105,7 @@ class Array:
                 else:
                     if isinstance(cdata, UncompressedPartialReadBufferV3):
                         cdata = cdata.read_full()
-                    chunk = ensure_ndarray_like(cdata).view(self._dtype)
-                    chunk = chunk.reshape(self._chunks, order=self._order)
-                    np.copyto(dest, chunk)
+                    np.copyto(dest, self._decode_chunk(cdata))
                 return
 
         # decode chunk
@@ -2060,16 +2113,16 @@ class Array:
             if partial_read_decode:
                 cdata.prepare_chunk()
                 # size of chunk
-                tmp = np.empty_like(self._meta_array, shape=self._chunks, dtype=self.dtype)
-                index_selection = PartialChunkIterator(chunk_selection, self.chunks)
+                tmp = np.empty_like(self._meta_array, shape=self._chunks, dtype=self._dtype)
+                index_selection = PartialChunkIterator(chunk_selection, self._chunks)
                 for start, nitems, partial_out_selection in index_selection:
                     expected_shape = [
                         (
-                            len(range(*partial_out_selection[i].indices(self.chunks[0] + 1)))
+                            len(range(*partial_out_selection[i].indices(self._chunks[0] + 1)))
                             if i < len(partial_out_selection)
                             else dim
                         )
-                        for i, dim in enumerate(self.chunks)
+                        for i, dim in enumerate(self._chunks)
                     ]
                     if isinstance(cdata, UncompressedPartialReadBufferV3):
                         chunk_partial = self._decode_chunk(
@@ -2131,7 +2184,8 @@ class Array:
             out_is_ndarray = False
 
         # Keys to retrieve
-        ckeys = [self._chunk_key(ch) for ch in lchunk_coords]
+        ckeys = self._chunk_keys(lchunk_coords)
+        chunk_store = self.chunk_store
 
         # Check if we can do a partial read
         if (
@@ -2140,43 +2194,48 @@ class Array:
             and self._compressor.codec_id == "blosc"
             and hasattr(self._compressor, "decode_partial")
             and not fields
-            and self.dtype != object
-            and hasattr(self.chunk_store, "getitems")
+            and self._dtype != object
+            and hasattr(chunk_store, "getitems")
         ):
             partial_read_decode = True
             cdatas = {
-                ckey: PartialReadBuffer(ckey, self.chunk_store)
+                ckey: PartialReadBuffer(ckey, chunk_store)
                 for ckey in ckeys
-                if ckey in self.chunk_store
+                if ckey in chunk_store
             }
         elif (
             self._partial_decompress
             and not self._compressor
             and not fields
-            and self.dtype != object
-            and hasattr(self.chunk_store, "get_partial_values")
-            and self.chunk_store.supports_efficient_get_partial_values
+            and self._dtype != object
+            and hasattr(chunk_store, "get_partial_values")
+            and chunk_store.supports_efficient_get_partial_values
         ):
             partial_read_decode = True
             cdatas = {
                 ckey: UncompressedPartialReadBufferV3(
-                    ckey, self.chunk_store, itemsize=self.itemsize
+                    ckey, chunk_store, itemsize=self._dtype.itemsize
                 )
                 for ckey in ckeys
-                if ckey in self.chunk_store
+                if ckey in chunk_store
             }
-        elif hasattr(self.chunk_store, "get_partial_values"):
+        elif (
+            hasattr(chunk_store, "get_partial_values")
+            and getattr(type(chunk_store), "getitems", BaseStore.getitems) is BaseStore.getitems
+        ):
+            # the default getitems() reads keys one at a time, stores which
+            # implement a bulk getitems() are read with that instead
             partial_read_decode = False
-            values = self.chunk_store.get_partial_values([(ckey, (0, None)) for ckey in ckeys])
+            values = chunk_store.get_partial_values([(ckey, (0, None)) for ckey in ckeys])
             cdatas = {key: value for key, value in zip(ckeys, values) if value is not None}
         else:
             partial_read_decode = False
             contexts = {}
             if not isinstance(self._meta_array, np.ndarray):
                 contexts = ConstantMap(ckeys, constant=Context(meta_array=self._meta_array))
-            cdatas = self.chunk_store.getitems(ckeys, contexts=contexts)
+            cdatas = chunk_store.getitems(ckeys, contexts=contexts)
 
-        for ckey, chunk_select, out_select in zip(ckeys, lchunk_selection, lout_selection):
+        def process(ckey, chunk_select, out_select):
             if ckey in cdatas:
                 self._process_chunk(
                     out,
@@ -2197,29 +2256,82 @@ class Array:
                         fill_value = self._fill_value
                     out[out_select] = fill_value
 
+        if partial_read_decode:
+            # partial reads go back to the store, keep them in this thread
+            for args in zip(ckeys, lchunk_selection, lout_selection):
+                process(*args)
+        else:
+            self._codec_map(process, ckeys, lchunk_selection, lout_selection)
+
     def _chunk_setitems(self, lchunk_coords, lchunk_selection, values, fields=None):
-        ckeys = map(self._chunk_key, lchunk_coords)
-        cdatas = {
-            key: self._process_for_setitem(key, sel, val, fields=fields)
-            for key, sel, val in zip(ckeys, lchunk_selection, values)
-        }
+        ckeys = self._chunk_keys(lchunk_coords)
+
+        # fetch the chunks which are only partially replaced in a single request,
+        # chunks which are replaced entirely are neither read nor decoded
+        lis_total = [not fields and is_total_slice(sel, self._chunks) for sel in lchunk_selection]
+        partial_keys = [key for key, is_total in zip(ckeys, lis_total) if not is_total]
+        existing_cdatas = {}
+        if partial_keys:
+            contexts = {}
+            if not isinstance(self._meta_array, np.ndarray):
+                contexts = ConstantMap(partial_keys, constant=Context(meta_array=self._meta_array))
+            existing_cdatas = self.chunk_store.getitems(partial_keys, contexts=contexts)
+
+        empty_keys = []
+        chunk_ids = {}
+        unique_chunks = {}
+        # chunks which are entirely replaced by the same scalar value are identical,
+        # so each of them is only built (and below, encoded) once
+        scalar_chunks = {}
+        for key, sel, val, is_total in zip(ckeys, lchunk_selection, values, lis_total):
+            if is_total and is_scalar(val, self._dtype):
+                if id(val) not in scalar_chunks:
+                    scalar_chunks[id(val)] = self._process_for_setitem(key, sel, val)
+                chunk, is_empty = scalar_chunks[id(val)]
+            else:
+                chunk, is_empty = self._process_for_setitem(
+                    key, sel, val, fields=fields, cdatas=existing_cdatas
+                )
+            if is_empty:
+                empty_keys.append(key)
+            else:
+                chunk_ids[key] = id(chunk)
+                unique_chunks[id(chunk)] = chunk
+        # only keep the references to the chunks which still need to be encoded
+        existing_cdatas = scalar_chunks = chunk = None
+        if empty_keys:
+            self._chunk_delitems(empty_keys)
+
+        def encode(chunk_id):
+            # drop each chunk as soon as it is encoded, so that the batch is not
+            # held in memory both as arrays and as encoded data
+            return self._encode_chunk(unique_chunks.pop(chunk_id))
+
+        unique_ids = list(unique_chunks)
+        encoded = dict(zip(unique_ids, self._codec_map(encode, unique_ids)))
         to_store = {}
-        if not self.write_empty_chunks:
-            empty_chunks = {k: v for k, v in cdatas.items() if all_equal(self.fill_value, v)}
-            self._chunk_delitems(empty_chunks.keys())
-            nonempty_keys = cdatas.keys() - empty_chunks.keys()
-            to_store = {k: self._encode_chunk(cdatas[k]) for k in nonempty_keys}
-        else:
-            to_store = {k: self._encode_chunk(v) for k, v in cdatas.items()}
+        stored = set()
+        for key, chunk_id in chunk_ids.items():
+            cdata = encoded[chunk_id]
+            if chunk_id in stored and not isinstance(cdata, bytes):
+                # never share a mutable buffer between keys
+                cdata = ensure_bytes(cdata)
+            stored.add(chunk_id)
+            to_store[key] = cdata
         self.chunk_store.setitems(to_store)
 
+    def _codec_map(self, func, *iterables):
+        """Apply `func` to the chunks in `iterables`, using the codec executor
+        if one has been provided."""
+        if self._codec_executor is None:
+            return list(map(func, *iterables))
+        return list(self._codec_executor.map(func, *iterables))
+
     def _chunk_delitems(self, ckeys):
-        if hasattr(self.store, "delitems"):
-            self.store.delitems(ckeys)
-        else:  # pragma: no cover
-            # exempting this branch from coverage as there are no extant stores
-            # that will trigger this condition, but it's possible that they
-            # will be developed in the future.
+        if hasattr(self.chunk_store, "delitems"):
+            self.chunk_store.delitems(ckeys)
+        else:
+            # delete one by one, ignoring chunks which were never initialized
             tuple(map(self._chunk_delitem, ckeys))
 
     def _chunk_delitem(self, ckey):
@@ -2258,15 +2370,26 @@ class Array:
 
     def _chunk_setitem_nosync(self, chunk_coords, chunk_selection, value, fields=None):
         ckey = self._chunk_key(chunk_coords)
-        cdata = self._process_for_setitem(ckey, chunk_selection, value, fields=fields)
+        cdata, is_empty = self._process_for_setitem(ckey, chunk_selection, value, fields=fields)
 
         # attempt to delete chunk if it only contains the fill value
-        if (not self.write_empty_chunks) and all_equal(self.fill_value, cdata):
+        if is_empty:
             self._chunk_delitem(ckey)
         else:
             self.chunk_store[ckey] = self._encode_chunk(cdata)
 
-    def _process_for_setitem(self, ckey, chunk_selection, value, fields=None):
+    def _process_for_setitem(self, ckey, chunk_selection, value, fields=None, cdatas=None):
+        """Return the updated chunk, and whether it only contains the fill value
+        and should not be stored (always False if empty chunks are written).
+
+        If given, `cdatas` maps the keys of chunks which have already been
+        retrieved from the store to their encoded data, any key missing from it
+        is treated as an uninitialized chunk."""
+
+        # region of the chunk which may differ from the fill value, only this
+        # part needs to be compared when checking for an empty chunk
+        check_region = None
+
         if is_total_slice(chunk_selection, self._chunks) and not fields:
             # totally replace chunk
 
@@ -2275,29 +2398,31 @@ class Array:
 
             if is_scalar(value, self._dtype):
                 # setup array filled with value
-                chunk = np.empty_like(
-                    self._meta_array, shape=self._chunks, dtype=self._dtype, order=self._order
-                )
-                chunk.fill(value)
+                chunk = self._full_chunk(value)
+                # every item holds the same value, so checking one is enough
+                check_region = chunk.reshape(-1, order="A")[:1]
 
             else:
                 # ensure array is contiguous
                 chunk = value.astype(self._dtype, order=self._order, copy=False)
+                check_region = chunk
 
         else:
             # partially replace the contents of this chunk
 
+            chunk_initialized = True
             try:
                 # obtain compressed data for chunk
-                cdata = self.chunk_store[ckey]
+                if cdatas is None:
+                    cdata = self.chunk_store[ckey]
+                else:
+                    cdata = cdatas[ckey]
 
             except KeyError:
                 # chunk not initialized
+                chunk_initialized = False
                 if self._fill_value is not None:
-                    chunk = np.empty_like(
-                        self._meta_array, shape=self._chunks, dtype=self._dtype, order=self._order
-                    )
-                    chunk.fill(self._fill_value)
+                    chunk = self._full_chunk(self._fill_value)
                 elif self._dtype == object:
                     chunk = np.empty(self._chunks, dtype=self._dtype, order=self._order)
                 else:
@@ -2321,6 +2446,31 @@ class Array:
             else:
                 chunk[chunk_selection] = value
 
+            if chunk_initialized or self._dtype == object:
+                check_region = chunk
+            else:
+                # the rest of a new chunk is known to hold the fill value
+                check_region = chunk[chunk_selection]
+
+        is_empty = not self._write_empty_chunks and all_equal(self._fill_value, check_region)
+        return chunk, is_empty
+
+    def _full_chunk(self, value):
+        """Allocate a new chunk with all items set to `value`."""
+        if (
+            type(self._meta_array) is np.ndarray
+            and self._dtype.kind in "biuf"
+            and value == 0
+            and not np.signbit(value)
+        ):
+            # N.B., unlike np.zeros_like(), np.zeros() obtains zeroed memory from
+            # the allocator without a separate fill pass, and pages are only
+            # touched once they are written to
+            return np.zeros(self._chunks, dtype=self._dtype, order=self._order)
+        chunk = np.empty_like(
+            self._meta_array, shape=self._chunks, dtype=self._dtype, order=self._order
+        )
+        chunk.fill(value)
         return chunk
 
     def _chunk_key(self, chunk_coords):
@@ -2338,7 +2488,29 @@ class Array:
         else:
             return self._key_prefix + self._dimension_separator.join(map(str, chunk_coords))
 
+    def _chunk_keys(self, lchunk_coords):
+        """Obtain the keys of many chunks at once, equivalent to calling
+        :meth:`_chunk_key` for each of `lchunk_coords`."""
+        if self._version == 3:
+            prefix = "data/root/" + self._key_prefix + "c"
+        else:
+            prefix = self._key_prefix
+        join = self._dimension_separator.join
+        return [prefix + join(map(str, chunk_coords)) for chunk_coords in lchunk_coords]
+
     def _decode_chunk(self, cdata, start=None, nitems=None, expected_shape=None):
+        if (
+            type(cdata) is bytes
+            and not self._compressor
+            and not self._filters
+            and self._dtype != object
+        ):
+            # optimization: data stored without any codecs only needs to be
+            # interpreted with the array's dtype and chunk shape
+            return np.frombuffer(cdata, dtype=self._dtype).reshape(
+                expected_shape or self._chunks, order=self._order
+            )
+
         # decompress
         if self._compressor:
             # only decode requested items
@@ -2514,8 +2686,7 @@ class Array:
         for i in itertools.product(*[range(s) for s in self.cdata_shape]):
             h.update(self.chunk_store.get(self._chunk_key(i), b""))
 
-        mkey = _prefix_to_array_key(self._store, self._key_prefix)
-        h.update(self.store.get(mkey, b""))
+        h.update(self.store.get(self._meta_key, b""))
 
         h.update(self.store.get(self.attrs.key, b""))
 
@@ -2562,6 +2733,8 @@ class Array:
             "write_empty_chunks": self._write_empty_chunks,
             "zarr_version": self._version,
             "meta_array": self._meta_array,
+            "chunk_batch_size": self._chunk_batch_size,
+            # N.B., executors cannot be pickled
         }
 
     def __setstate__(self, state):
@@ -2574,8 +2747,7 @@ class Array:
 
         else:
             # synchronize on the array
-            mkey = _prefix_to_array_key(self._store, self._key_prefix)
-            lock = self._synchronizer[mkey]
+            lock = self._synchronizer[self._meta_key]
 
         with lock:
             self._refresh_metadata_nosync()
@@ -2642,25 +2814,23 @@ class Array:
         #   Note that a mutable list ('old_cdata_shape_working_list') is introduced here
         #     to dynamically adjust the number of chunks along the already-processed dimensions
         #     in order to avoid duplicate chunk removal.
-        chunk_store = self.chunk_store
         old_cdata_shape_working_list = list(old_cdata_shape)
         for idx_cdata, (val_old_cdata, val_new_cdata) in enumerate(
             zip(old_cdata_shape_working_list, new_cdata_shape)
         ):
-            for cidx in itertools.product(
+            lchunk_coords = itertools.product(
                 *[
                     range(n_new, n_old) if (idx == idx_cdata) else range(n_old)
                     for idx, (n_old, n_new) in enumerate(
                         zip(old_cdata_shape_working_list, new_cdata_shape)
                     )
                 ]
-            ):
-                key = self._chunk_key(cidx)
-                try:
-                    del chunk_store[key]
-                except KeyError:
-                    # chunk not initialized
-                    pass
+            )
+            while True:
+                batch = list(itertools.islice(lchunk_coords, _RESIZE_DELETE_BATCH_SIZE))
+                if not batch:
+                    break
+                self._chunk_delitems(self._chunk_keys(batch))
             old_cdata_shape_working_list[idx_cdata] = min(val_old_cdata, val_new_cdata)
 
     def append(self, data, axis=0):
@@ -2869,6 +3039,8 @@ class Array:
             synchronizer=synchronizer,
             cache_metadata=True,
             zarr_version=self._version,
+            chunk_batch_size=self._chunk_batch_size,
+            codec_executor=self._codec_executor,
         )
         a._is_view = True
 
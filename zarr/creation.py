@@ -1,4 +1,5 @@
 from collections.abc import MutableMapping
+from concurrent.futures import Executor
 from typing import Optional, Tuple, Union, Sequence
 from warnings import warn
 
@@ -51,6 +52,8 @@ def create(
     zarr_version: Optional[ZARR_VERSION] = None,
     meta_array: Optional[MetaArray] = None,
     storage_transformers: Sequence[StorageTransformer] = (),
+    chunk_batch_size: Optional[int] = None,
+    codec_executor: Optional[Executor] = None,
     **kwargs,
 ):
     """Create an array.
@@ -136,6 +139,21 @@ def create(
 
         .. versionadded:: 2.13
 
+    chunk_batch_size : int, optional
+        Maximum number of chunks retrieved from, or stored to, the chunk store
+        in a single ``getitems``/``setitems`` call. If None (default), all
+        chunks overlapping a selection are processed in a single batch.
+
+        .. versionadded:: 2.18
+
+    codec_executor : concurrent.futures.Executor, optional
+        Executor used to decode and encode the chunks of a selection
+        concurrently. Chunks are only encoded with the executor when the chunk
+        store implements ``setitems`` and no synchronizer is used. If None
+        (default), chunks are processed sequentially in the calling thread.
+
+        .. versionadded:: 2.18
+
     Returns
     -------
     z : zarr.core.Array
@@ -234,6 +252,8 @@ def create(
         read_only=read_only,
         write_empty_chunks=write_empty_chunks,
         meta_array=meta_array,
+        chunk_batch_size=chunk_batch_size,
+        codec_executor=codec_executor,
     )
 
     return z
@@ -472,6 +492,8 @@ def open_array(
     zarr_version=None,
     dimension_separator: Optional[DIMENSION_SEPARATOR] = None,
     meta_array=None,
+    chunk_batch_size=None,
+    codec_executor=None,
     **kwargs,
 ):
     """Open an array using file-mode-like semantics.
@@ -552,6 +574,21 @@ def open_array(
 
         .. versionadded:: 2.15
 
+    chunk_batch_size : int, optional
+        Maximum number of chunks retrieved from, or stored to, the chunk store
+        in a single ``getitems``/``setitems`` call. If None (default), all
+        chunks overlapping a selection are processed in a single batch.
+
+        .. versionadded:: 2.18
+
+    codec_executor : concurrent.futures.Executor, optional
+        Executor used to decode and encode the chunks of a selection
+        concurrently. Chunks are only encoded with the executor when the chunk
+        store implements ``setitems`` and no synchronizer is used. If None
+        (default), chunks are processed sequentially in the calling thread.
+
+        .. versionadded:: 2.18
+
     Returns
     -------
     z : zarr.core.Array
@@ -696,6 +733,8 @@ def open_array(
         chunk_store=chunk_store,
         write_empty_chunks=write_empty_chunks,
         meta_array=meta_array,
+        chunk_batch_size=chunk_batch_size,
+        codec_executor=codec_executor,
     )
 
     return z
@@ -1067,11 +1067,11 @@ class PartialChunkIterator:
 
     def __iter__(self):
         chunk1 = self.chunk_loc_slices[0]
-        nitems = (chunk1[-1].stop - chunk1[-1].start) * np.prod(
-            self.arr_shape[len(chunk1) :], dtype=int
-        )
+        nitems = (chunk1[-1].stop - chunk1[-1].start) * math.prod(self.arr_shape[len(chunk1) :])
+        # number of items spanned by a unit step along each dimension
+        strides = [math.prod(self.arr_shape[i + 1 :]) for i in range(len(chunk1))]
         for partial_out_selection in self.chunk_loc_slices:
             start = 0
-            for i, sl in enumerate(partial_out_selection):
-                start += sl.start * np.prod(self.arr_shape[i + 1 :], dtype=int)
+            for sl, stride in zip(partial_out_selection, strides):
+                start += sl.start * stride
             yield start, nitems, partial_out_selection
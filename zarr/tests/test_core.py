@@ -1,10 +1,15 @@
 import atexit
+import itertools
 import os
 import sys
 import pickle
+import weakref
 import shutil
+import threading
 from typing import Any, Literal, Optional, Tuple, Union, Sequence
 import unittest
+from concurrent.futures import Executor, ThreadPoolExecutor
+from unittest import mock
 from itertools import zip_longest
 from tempfile import mkdtemp
 import numpy as np
@@ -74,6 +79,7 @@ from zarr._storage.v3 import (
 from zarr.tests.test_storage_v3 import DummyStorageTransfomer
 from zarr.util import buffer_size
 from zarr.tests.util import (
+    CountingDictV3,
     abs_container,
     have_bsddb3,
     have_fsspec,
@@ -98,6 +104,8 @@ class TestArray:
     cache_attrs = True
     partial_decompress: bool = False
     write_empty_chunks = True
+    chunk_batch_size: Optional[int] = None
+    codec_executor: Optional[Executor] = None
     read_only = False
     storage_transformers: Tuple[Any, ...] = ()
 
@@ -135,6 +143,8 @@ class TestArray:
             "cache_attrs": kwargs.pop("cache_attrs", self.cache_attrs),
             "partial_decompress": kwargs.pop("partial_decompress", self.partial_decompress),
             "write_empty_chunks": kwargs.pop("write_empty_chunks", self.write_empty_chunks),
+            "chunk_batch_size": kwargs.pop("chunk_batch_size", self.chunk_batch_size),
+            "codec_executor": kwargs.pop("codec_executor", self.codec_executor),
         }
 
         init_array(store, shape, **{**init_array_kwargs, **kwargs})
@@ -1088,6 +1098,44 @@ class TestArray:
 
             z.store.close()
 
+    def test_chunk_keys(self):
+        z = self.create_array(shape=(20, 20, 20), chunks=(5, 5, 5), dtype="i1")
+        lchunk_coords = [(0, 0, 0), (1, 2, 3), (3, 0, 2)]
+        assert [z._chunk_key(c) for c in lchunk_coords] == z._chunk_keys(lchunk_coords)
+        assert [] == z._chunk_keys([])
+
+    def test_decode_chunk_uncompressed(self):
+        z = self.create_array(shape=(6, 4), chunks=(3, 4), dtype=">i4", compressor=None)
+        a = np.arange(24, dtype=z.dtype).reshape(6, 4)
+        z[:] = a
+        chunk = z._decode_chunk(ensure_bytes(z._encode_chunk(a[:3])))
+        assert_array_equal(a[:3], chunk)
+        assert chunk.dtype == z.dtype
+        assert_array_equal(a, z[:])
+        assert_array_equal(a[1:5, 1:3], z[1:5, 1:3])
+        z[4:, 1:] = 0
+        a[4:, 1:] = 0
+        assert_array_equal(a, z[:])
+
+    def test_write_empty_chunks_partial(self):
+        z = self.create_array(shape=20, chunks=10, fill_value=0, dtype="i4", write_empty_chunks=False)
+        z[2:5] = 0
+        assert 0 == z.nchunks_initialized
+        z[2:5] = 1
+        assert 1 == z.nchunks_initialized
+        z[2:5] = 0
+        assert 0 == z.nchunks_initialized
+        z[12] = 0
+        assert 0 == z.nchunks_initialized
+        z[12] = 3
+        z[[3, 5]] = [0, 7]
+        assert 2 == z.nchunks_initialized
+        z[:] = 0
+        assert 0 == z.nchunks_initialized
+        assert_array_equal(np.zeros(20, dtype="i4"), z[:])
+
+        z.store.close()
+
     def test_array_dtype_shape(self):
         dt = "(2, 2)f4"
         # setup some data
@@ -2393,6 +2441,90 @@ class TestArrayWithFSStore(TestArray):
         )
         return store
 
+    def test_setitems_reads_partial_chunks_only(self):
+        z = self.create_array(shape=20, chunks=5, dtype="i4")
+        z[:] = 1
+        store = z.chunk_store
+        with mock.patch.object(store, "getitems", wraps=store.getitems) as spy:
+            z[5:15] = 2
+            spy.assert_not_called()
+            z[3:20] = 3
+            spy.assert_called_once()
+            assert [z._chunk_key((0,))] == spy.call_args[0][0]
+        assert_array_equal([1, 1, 1] + [3] * 17, z[:])
+
+    def test_setitems_releases_encoded_chunks(self):
+        z = self.create_array(
+            shape=20, chunks=5, dtype="i4", chunk_batch_size=None, codec_executor=None
+        )
+        z[:] = 1
+        encode_chunk = z._encode_chunk
+        refs = []
+
+        def spy(chunk):
+            # chunks which have already been encoded are no longer referenced
+            assert all(ref() is None for ref in refs)
+            refs.append(weakref.ref(chunk))
+            return encode_chunk(chunk)
+
+        z._encode_chunk = spy
+        z[1:19] = 2
+        # two partial chunks plus one shared whole chunk
+        assert len(refs) == 3
+        assert_array_equal([1] + [2] * 18 + [1], z[:])
+
+    def test_resize_deletes_in_bulk(self):
+        z = self.create_array(shape=(20, 20), chunks=(5, 5), dtype="i4")
+        z[:] = 1
+        store = z.chunk_store
+        with mock.patch.object(store, "delitems", wraps=store.delitems) as spy:
+            z.resize(10, 15)
+        # one request per shrunk dimension
+        assert spy.call_count == 2
+        assert sorted(z._chunk_key(c) for c in itertools.product(range(2), range(3))) == sorted(
+            k for k in store.keys() if not k.startswith(".z")
+        )
+        assert_array_equal(np.ones((10, 15), dtype="i4"), z[:])
+
+    def test_resize_deletes_in_batches(self):
+        z = self.create_array(shape=(20, 20), chunks=(5, 5), dtype="i4")
+        z[:] = 1
+        store = z.chunk_store
+        with mock.patch("zarr.core._RESIZE_DELETE_BATCH_SIZE", 5), mock.patch.object(
+            store, "delitems", wraps=store.delitems
+        ) as spy:
+            z.resize(5, 20)
+        # 12 stale chunks along the first dimension
+        assert [5, 5, 2] == [len(call[0][0]) for call in spy.call_args_list]
+        assert 4 == len([k for k in store.keys() if not k.startswith(".z")])
+        assert_array_equal(np.ones((5, 20), dtype="i4"), z[:])
+
+    def test_setitems_scalar_encodes_once(self):
+        z = self.create_array(shape=(20, 20), chunks=(5, 5), dtype="i4", chunk_batch_size=None)
+        with mock.patch.object(z, "_encode_chunk", wraps=z._encode_chunk) as spy:
+            z[:] = 7
+            # all 16 chunks are identical
+            spy.assert_called_once()
+            spy.reset_mock()
+            z[2:, :] = 8
+            # 4 partial chunks plus one shared whole chunk
+            assert spy.call_count == 5
+        expect = np.full((20, 20), 8, dtype="i4")
+        expect[:2] = 7
+        assert_array_equal(expect, z[:])
+        z[0, 0] = 9
+        assert z[0, 0] == 9
+        assert z[0, 5] == 7
+
+    def test_setitems_drop_axes(self):
+        z = self.create_array(shape=(10, 10), chunks=(5, 5), dtype="i4")
+        z[:] = 0
+        # an integer in an orthogonal selection drops an axis of the value
+        z.oindex[[0, 6], 3] = [5, 6]
+        expect = np.zeros((10, 10), dtype="i4")
+        expect[[0, 6], 3] = [5, 6]
+        assert_array_equal(expect, z[:])
+
     def expected(self):
         return [
             "ab753fc81df0878589535ca9bad2816ba88d91bc",
@@ -2497,6 +2629,45 @@ class TestArrayWithFSStoreNested(TestArrayWithFSStore):
         ]
 
 
+@pytest.mark.skipif(have_fsspec is False, reason="needs fsspec")
+class TestArrayWithFSStoreChunkBatchSize(TestArrayWithFSStore):
+    chunk_batch_size = 3
+
+    def test_chunk_batch_size(self):
+        z = self.create_array(shape=(20, 20), chunks=(3, 3), dtype="i4")
+        assert 3 == z.chunk_batch_size
+        a = np.arange(400, dtype="i4").reshape(20, 20)
+        z[:] = a
+        assert_array_equal(a, z[:])
+        assert_array_equal(a[2:17, 5:], z[2:17, 5:])
+        assert 49 == z.nchunks_initialized
+
+        with pytest.raises(ValueError):
+            self.create_array(shape=100, chunks=10, chunk_batch_size=0)
+        with pytest.raises(ValueError):
+            self.create_array(shape=100, chunks=10, chunk_batch_size=2.5)
+
+
+@pytest.mark.skipif(have_fsspec is False, reason="needs fsspec")
+class TestArrayWithFSStoreCodecExecutor(TestArrayWithFSStore):
+    def setup_method(self):
+        self.codec_executor = ThreadPoolExecutor(max_workers=4)
+
+    def teardown_method(self):
+        self.codec_executor.shutdown()
+
+    def test_codec_executor(self):
+        z = self.create_array(shape=(20, 20), chunks=(3, 3), dtype="f8")
+        assert z.codec_executor is self.codec_executor
+        assert z.view().codec_executor is self.codec_executor
+        a = np.random.default_rng(0).random((20, 20))
+        z[:] = a
+        assert_array_equal(a, z[:])
+        assert_array_equal(a[::3, 1:4], z.oindex[::3, 1:4])
+        # the executor is not pickled
+        assert pickle.loads(pickle.dumps(z)).codec_executor is None
+
+
 @pytest.mark.skipif(have_fsspec is False, reason="needs fsspec")
 class TestArrayWithFSStoreNestedPartialRead(TestArrayWithFSStore):
     compressor = Blosc()
@@ -2901,6 +3072,18 @@ class TestArrayNoCacheV3(TestArrayWithPathV3):
         # skip this one as it only works if metadata are cached
         pass
 
+    def test_hierarchy_metadata_read_once(self):
+        store = CountingDictV3()
+        init_array(store, shape=100, chunks=10, path="arr1", dtype="i4")
+        store.counter.clear()
+        z = Array(store, path="arr1", cache_metadata=False)
+        n_reads = store.counter["__getitem__", "zarr.json"]
+        z[:5]
+        z[5:] = 1
+        z.resize(200)
+        # the metadata key is resolved once, operations do not re-read zarr.json
+        assert store.counter["__getitem__", "zarr.json"] == n_reads
+
 
 @pytest.mark.skipif(not v3_api_available, reason="V3 is disabled")
 class TestArrayWithStoreCacheV3(TestArrayV3):
@@ -2932,6 +3115,18 @@ class TestArrayWithFSStoreV3(TestArrayV3):
         )
         return store
 
+    def test_getitems_bulk_read(self):
+        z = self.create_array(shape=20, chunks=5, dtype="i4", partial_decompress=False)
+        z[:] = np.arange(20)
+        store = z.chunk_store
+        with mock.patch.object(
+            store, "get_partial_values", wraps=store.get_partial_values
+        ) as partial_spy, mock.patch.object(store, "getitems", wraps=store.getitems) as spy:
+            assert_array_equal(np.arange(3, 18), z[3:18])
+        # all chunks are fetched by a single bulk request
+        spy.assert_called_once()
+        partial_spy.assert_not_called()
+
     def expected(self):
         return [
             "1509abec4285494b61cd3e8d21f44adc3cf8ddf6",
@@ -3014,6 +3209,24 @@ class TestArrayWithFSStoreV3PartialReadUncompressedSharded(TestArrayWithFSStoreV
         assert z.chunk_store.supports_efficient_get_partial_values
         assert not z.chunk_store.supports_efficient_set_partial_values()
 
+    def test_getitems_bulk_read(self):
+        # skip as the sharding transformer only reads via get_partial_values
+        pass
+
+    def test_get_partial_values_coalesced(self):
+        z = self.create_array(shape=40, chunks=10, dtype="i4", partial_decompress=False)
+        a = np.arange(40, dtype="i4")
+        z[:] = a
+        inner_store = z.chunk_store.inner_store
+        with mock.patch.object(
+            inner_store, "get_partial_values", wraps=inner_store.get_partial_values
+        ) as spy:
+            assert_array_equal(a, z[:])
+        # the two chunks of each shard are read with a single range request
+        key_ranges = spy.call_args_list[-1][0][0]
+        assert 2 == len(key_ranges)
+        assert [80, 80] == [length for _, (_, length) in key_ranges]
+
     def expected(self):
         return [
             "90109fc2a4e17efbcb447003ea1c08828b91f71e",
@@ -3107,6 +3320,52 @@ class TestArrayWithShardingStorageTransformerV3(TestArrayV3):
         assert not z.chunk_store.supports_efficient_get_partial_values
         assert not z.chunk_store.supports_efficient_set_partial_values()
 
+    @pytest.mark.parametrize("cache_metadata", [True, False])
+    @pytest.mark.parametrize("second_array", [False, True])
+    def test_concurrent_chunk_writes(self, cache_metadata, second_array):
+        z = self.create_array(shape=20, chunks=5, dtype="i4", cache_metadata=cache_metadata)
+        z[:] = 9
+        # chunks 0 and 1 are stored in the same shard
+        shard_key, _ = z.chunk_store._key_to_shard(z._chunk_key((0,)))
+        assert shard_key == z.chunk_store._key_to_shard(z._chunk_key((1,)))[0]
+
+        # make both writers read the shard before either of them stores it, unless
+        # the second one is kept waiting, in which case the barrier times out
+        barrier = threading.Barrier(2, timeout=0.5)
+
+        class BarrierDict(dict):
+            def __getitem__(self, key):
+                value = super().__getitem__(key)
+                if key == shard_key:
+                    try:
+                        barrier.wait()
+                    except threading.BrokenBarrierError:
+                        pass
+                return value
+
+        z._store._mutable_mapping = BarrierDict(z._store._mutable_mapping)
+        if second_array:
+            z2 = Array(z._store, path=z.path, cache_metadata=cache_metadata)
+        else:
+            z2 = z
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(z.__setitem__, slice(0, 5), 1)]
+            futures.append(pool.submit(z2.__setitem__, slice(5, 10), 2))
+            for future in futures:
+                future.result()
+        assert_array_equal([1] * 5 + [2] * 5 + [9] * 10, z[:])
+
+    def test_get_partial_values_views(self):
+        z = self.create_array(shape=40, chunks=10, dtype="i4")
+        z[:] = np.arange(40, dtype="i4")
+        keys = [z._chunk_key((i,)) for i in range(4)]
+        values = z.chunk_store.get_partial_values([(k, (0, None)) for k in keys])
+        assert all(isinstance(v, memoryview) for v in values)
+        assert [z.chunk_store[k] for k in keys] == [bytes(v) for v in values]
+        assert [bytes(v[4:8]) for v in values] == [
+            bytes(v) for v in z.chunk_store.get_partial_values([(k, (4, 4)) for k in keys])
+        ]
+
     def expected(self):
         return [
             "90109fc2a4e17efbcb447003ea1c08828b91f71e",
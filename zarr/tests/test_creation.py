@@ -2,11 +2,14 @@ import atexit
 import os.path
 import shutil
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
 
+import zarr
+
 from zarr._storage.store import DEFAULT_ZARR_VERSION
 from zarr.codecs import Zlib
 from zarr.core import Array
@@ -750,6 +753,35 @@ def test_create_with_storage_transformers(at_root):
     assert z.chunk_store.test_value == DummyStorageTransfomer.TEST_CONSTANT
 
 
+@pytest.mark.parametrize("zarr_version", _VERSIONS)
+def test_create_chunk_batch_size(zarr_version):
+    kwargs = _init_creation_kwargs(zarr_version, at_root=False)
+    z = create(100, chunks=10, chunk_batch_size=3, **kwargs)
+    assert 3 == z.chunk_batch_size
+    z[:] = 42
+    store = z.store
+    assert 3 == open_array(store, chunk_batch_size=3, **kwargs).chunk_batch_size
+    assert 3 == zarr.open(store, chunk_batch_size=3, **kwargs).chunk_batch_size
+    assert open_array(store, **kwargs).chunk_batch_size is None
+    with pytest.raises(ValueError):
+        create(100, chunks=10, chunk_batch_size=2.5, **kwargs)
+
+
+@pytest.mark.parametrize("zarr_version", _VERSIONS)
+def test_create_codec_executor(zarr_version):
+    kwargs = _init_creation_kwargs(zarr_version, at_root=False)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        z = create(100, chunks=10, codec_executor=executor, **kwargs)
+        assert z.codec_executor is executor
+        z[:] = np.arange(100)
+        store = z.store
+        z = open_array(store, codec_executor=executor, **kwargs)
+        assert z.codec_executor is executor
+        assert_array_equal(np.arange(100), z[:])
+        assert zarr.open(store, codec_executor=executor, **kwargs).codec_executor is executor
+    assert open_array(store, **kwargs).codec_executor is None
+
+
 @pytest.mark.parametrize(
     ("init_shape", "init_chunks", "shape", "chunks"),
     (
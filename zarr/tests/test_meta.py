@@ -5,6 +5,7 @@ import json
 import numpy as np
 import pytest
 
+import zarr
 from zarr.codecs import Blosc, Delta, Pickle, Zlib
 from zarr.errors import MetadataError
 from zarr.meta import (
@@ -22,6 +23,7 @@ from zarr.meta import (
     _default_entry_point_metadata_v3,
     Metadata3,
 )
+from zarr.storage import MemoryStore
 from zarr.util import normalize_dtype, normalize_fill_value
 
 
@@ -483,6 +485,60 @@ def test_decode_array_missing_fields():
         decode_array_metadata(meta_json)
 
 
+def test_decode_array_metadata_independent():
+    meta_json = b"""{
+        "zarr_format": 2,
+        "shape": [100],
+        "chunks": [10],
+        "dtype": "<f8",
+        "compressor": {"id": "zlib", "level": 1},
+        "fill_value": 0,
+        "filters": null,
+        "order": "C"
+    }"""
+    meta = decode_array_metadata(meta_json)
+    # decoding the same document again returns an equal, independent mapping
+    meta_again = decode_array_metadata(meta_json)
+    assert meta_again == meta
+    assert meta_again is not meta
+    meta_again["shape"] = (200,)
+    assert decode_array_metadata(meta_json)["shape"] == (100,)
+
+
+def test_decode_array_metadata_independent_nested():
+    meta_json = b"""{
+        "zarr_format": 2,
+        "shape": [100],
+        "chunks": [10],
+        "dtype": [["a", "<i4"], ["b", "<f8"]],
+        "compressor": {"id": "zlib", "level": 1},
+        "fill_value": "AQAAAAAAAAAAAABA",
+        "filters": [{"id": "delta", "dtype": "<i4"}],
+        "order": "C"
+    }"""
+    meta = decode_array_metadata(meta_json)
+    assert meta["fill_value"]["a"] == 1
+    # modifying nested values does not affect later decodes of the same document
+    meta["fill_value"]["a"] = 99
+    meta["compressor"]["level"] = 9
+    meta["filters"][0]["dtype"] = "<i8"
+    meta["filters"].append({"id": "zlib"})
+    meta_again = decode_array_metadata(meta_json)
+    assert meta_again["fill_value"]["a"] == 1
+    assert meta_again["fill_value"]["b"] == 2.0
+    assert meta_again["compressor"] == {"id": "zlib", "level": 1}
+    assert meta_again["filters"] == [{"id": "delta", "dtype": "<i4"}]
+
+    # the same holds for arrays opened from a store
+    store = MemoryStore()
+    dtype = [("a", "i4"), ("b", "f8")]
+    zarr.create(shape=10, chunks=5, dtype=dtype, fill_value=(1, 2.0), store=store)
+    zarr.open_array(store).fill_value["a"] = 99
+    z = zarr.open_array(store)
+    assert z.fill_value["a"] == 1
+    assert z[0]["a"] == 1
+
+
 def test_encode_decode_dtype():
     for dt in ["f8", [("a", "f8")], [("a", "f8"), ("b", "i1")]]:
         e = encode_dtype(np.dtype(dt))
@@ -244,7 +244,7 @@ class StoreV3Tests(_StoreTests):
         assert default_compressor == meta["compressor"]
         assert meta["fill_value"] is None
         # Missing MUST be assumed to be "/"
-        assert meta["chunk_grid"]["separator"] is want_dim_sep
+        assert meta["chunk_grid"]["separator"] == want_dim_sep
         assert len(meta["storage_transformers"]) == 1
         assert isinstance(meta["storage_transformers"][0], DummyStorageTransfomer)
         assert meta["storage_transformers"][0].test_value == DummyStorageTransfomer.TEST_CONSTANT
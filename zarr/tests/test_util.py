@@ -1,4 +1,5 @@
 import re
+import tracemalloc
 from unittest import mock
 
 import numpy as np
@@ -15,6 +16,7 @@ from zarr.util import (
     info_text_report,
     is_total_slice,
     json_dumps,
+    json_loads,
     normalize_chunks,
     normalize_dimension_separator,
     normalize_fill_value,
@@ -271,6 +273,52 @@ def test_all_equal():
     assert not all_equal(None, np.array([None, 10]))
 
 
+def test_all_equal_blockwise():
+    # arrays larger than a single comparison block
+    a = np.zeros((300, 300), dtype="f8")
+    assert all_equal(0, a)
+    assert not all_equal(1, a)
+    a[-1, -1] = 1
+    assert not all_equal(0, a)
+
+    a = np.full((300, 300), 42, dtype="i4", order="F")
+    assert all_equal(42, a)
+    a[150, 150] = 0
+    assert not all_equal(42, a)
+
+    a = np.full(300 * 300, np.nan)
+    assert all_equal(np.nan, a)
+    a[-1] = 0
+    assert not all_equal(np.nan, a)
+
+    # non-contiguous views
+    a = np.zeros((600, 600), dtype="u1")
+    assert all_equal(0, a[::2, ::2])
+    a[-2, -2] = 1
+    assert not all_equal(0, a[::2, ::2])
+    a = np.ones((600, 600), dtype="u1")
+    assert all_equal(1, a[::2, ::2])
+    a[-2, -2] = 0
+    assert not all_equal(1, a[::2, ::2])
+    a = np.full((4, 10, 70000), 3, dtype="i2")
+    assert all_equal(3, a[:, :, 1:])
+    a[-1, -1, -1] = 0
+    assert not all_equal(3, a[:, :, 1:])
+
+
+def test_all_equal_blockwise_memory():
+    a = np.ones((1000, 1000))
+    view = a[:, :500]
+    tracemalloc.start()
+    try:
+        assert all_equal(1.0, view)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # neither the view is copied nor a full-size mask allocated
+    assert peak < view.size
+
+
 def test_json_dumps_numpy_dtype():
     assert json_dumps(np.int64(0)) == json_dumps(0)
     assert json_dumps(np.float32(0)) == json_dumps(float(0))
@@ -279,6 +327,32 @@ def test_json_dumps_numpy_dtype():
         json_dumps(Array)
 
 
+def test_json_loads():
+    meta = {"shape": [100], "fill_value": "NaN", "attrs": {"foo": ["bar", 1.5, None]}}
+    assert json_loads(json_dumps(meta)) == meta
+    assert json_loads(json_dumps(meta).decode("ascii")) == meta
+    assert json_loads(bytearray(json_dumps(meta))) == meta
+    # values only accepted by the standard library parser
+    assert np.isnan(json_loads(json_dumps({"a": np.nan}))["a"])
+    assert json_loads(json_dumps({"a": -np.inf}))["a"] == -np.inf
+    assert json_loads(json_dumps({"a": 2**70}))["a"] == 2**70
+    with pytest.raises(ValueError):
+        json_loads(b"{")
+
+
+def test_json_loads_orjson():
+    orjson = pytest.importorskip("orjson")
+    doc = json_dumps({"shape": [100], "attrs": {"a": 1.5}})
+    with mock.patch("zarr.util.orjson.loads", wraps=orjson.loads) as spy:
+        assert json_loads(doc) == {"shape": [100], "attrs": {"a": 1.5}}
+        spy.assert_called_once_with(doc)
+        # documents rejected by orjson are parsed by the standard library
+        assert np.isnan(json_loads(json_dumps({"a": np.nan}))["a"])
+        assert spy.call_count == 2
+    with mock.patch("zarr.util.orjson", None):
+        assert json_loads(doc) == {"shape": [100], "attrs": {"a": 1.5}}
+
+
 def test_constant_map():
     val = object()
     m = ConstantMap(keys=[1, 2], constant=val)
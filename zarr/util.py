@@ -33,6 +33,11 @@ from numcodecs.registry import codec_registry
 from numcodecs.blosc import cbuffer_sizes, cbuffer_metainfo
 from zarr.types import DIMENSION_SEPARATOR
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 KeyType = TypeVar("KeyType")
 ValueType = TypeVar("ValueType")
 
@@ -73,6 +78,14 @@ def json_dumps(o: Any) -> bytes:
 
 def json_loads(s: Union[bytes, str]) -> Dict[str, Any]:
     """Read JSON in a consistent way."""
+    if orjson is not None and isinstance(s, (bytes, str)):
+        # use the faster parser when it is installed
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # e.g., NaN and Infinity, which json_dumps() writes for attributes, or
+            # integers beyond 64 bits, are only accepted by the standard library
+            pass
     return json.loads(ensure_text(s, "utf-8"))
 
 
@@ -689,6 +702,27 @@ def retry_call(
                 raise
 
 
+# number of elements compared at a time when checking a numpy array against
+# a scalar value, bounding the size of the temporary boolean mask
+_ALL_EQUAL_BLOCK_SIZE = 2**16
+
+
+def _all_blocks(predicate: Callable[[np.ndarray], Any], array: np.ndarray) -> bool:
+    """Test if `predicate` holds for every block of `array`, returning as soon
+    as it fails for one of them. Blocks are views, `array` is never copied."""
+    if array.flags.c_contiguous or array.flags.f_contiguous:
+        flat = array.reshape(-1, order="A")
+        blocks = (
+            flat[start : start + _ALL_EQUAL_BLOCK_SIZE]
+            for start in range(0, flat.size, _ALL_EQUAL_BLOCK_SIZE)
+        )
+    else:
+        # flattening would copy, so take sub-blocks along the first axis instead
+        step = max(1, _ALL_EQUAL_BLOCK_SIZE // (array.size // array.shape[0]))
+        blocks = (array[start : start + step] for start in range(0, array.shape[0], step))
+    return all(predicate(block) for block in blocks)
+
+
 def all_equal(value: Any, array: Any):
     """
     Test if all the elements of an array are equivalent to a value.
@@ -698,6 +732,18 @@ def all_equal(value: Any, array: Any):
 
     if value is None:
         return False
+    if (
+        value
+        and type(array) is np.ndarray
+        and array.size > _ALL_EQUAL_BLOCK_SIZE
+        and array.dtype.kind in "biufcmM"
+        and np.ndim(value) == 0
+    ):
+        # compare block by block, so that no full-size boolean mask is
+        # allocated and the check stops at the first block that differs
+        if np.issubdtype(array.dtype, np.floating) and np.isnan(value):
+            return _all_blocks(lambda block: np.all(np.isnan(block)), array)
+        return _all_blocks(lambda block: np.all(value == block), array)
     if not value:
         # if `value` is falsey, then just 1 truthy value in `array`
         # is sufficient to return False. We assume here that np.any is